@@ -1,8 +1,7 @@
 # python 3.11
 from paho.mqtt import client as mqtt_client
-import base64
 import logging
-import json
+import msgspec
 from PIL import Image
 import io
 from datetime import datetime
@@ -50,12 +49,12 @@ def subscribe(client: mqtt_client.Client):
         logging.info(f"Time taken to receive: {time_difference.total_seconds():.2f} seconds")
 
         try:
-            # Parse the JSON message
-            payload = json.loads(msg.payload)
+            # Parse the MessagePack message
+            payload = msgspec.msgpack.decode(msg.payload)
 
             # Extract timestamp and image data
             timestamp_str = payload['timestamp']
-            image_base64 = payload['image']
+            image_data = payload['image']
             cpu_temp = payload['cpuTemp']
             battery_temp = payload['batteryTemp']
             battery_percentage = payload['batteryCharge']
@@ -63,9 +62,6 @@ def subscribe(client: mqtt_client.Client):
             # Parse the timestamp string
             timestamp = parser.isoparse(timestamp_str)
 
-            # Decode the Base64 image data
-            image_data = base64.b64decode(image_base64)
-
             # Create a timestamp string for filenames
             time_string = timestamp.strftime("%Y%m%d_%H%M%S")
 
@@ -230,12 +230,12 @@ The defaul config.json message:
 
 **Publish topic:** `mqtt/rpi/image`
 
-Example message:
+The message is MessagePack-encoded (the JPEG travels as raw binary, no base64). Decoded, it looks like this:
 
 ```json
 {
      "timestamp":"2024-07-11T18:52:05.179690+00:00",
-     "image":"/9j/4AAQSkZJRgABAQAAAQAB...."
+     "image": <raw JPEG bytes>,
      "cpuTemp":35.6,
      "batteryTemp":48.5,
      "batteryCharge": 95
@@ -243,6 +243,7 @@ Example message:
 ```
 
 - Along with the image we also send a timestamp (ISO8601), and a few hardware values.
+- Decode with `msgspec.msgpack.decode` (or any MessagePack library); see `mqtt_subscribe.py` for an example.
 
 **Publish topic:** `er-edge/logging`
 
@@ -123,6 +123,8 @@ class App:
                 if self.schedule.should_shutdown(waiting_time):
                     shutdown_duration = self.schedule.calculate_shutdown_duration(waiting_time)
                     logging.info(f"Shutdown duration is: {shutdown_duration} seconds")
+                    # Make sure the image has left the device before powering down
+                    self.transmit.wait_for_publish()
                     System.schedule_wakeup(int(shutdown_duration))
                 else:
                     logging.info(f"Sleeping for {waiting_time} seconds")
@@ -148,10 +150,10 @@ class App:
         ------------------------
         - `wakeUpTime` and `shutDownTime`: Define the working hours during which the application is active.
         - `period`: Determines the interval between consecutive image captures and transmissions.
-        - `quality`: Sets the quality of images captured by the camera.
+        - `quality`: Sets the resolution preset of the images captured by the camera.
         """
         self.schedule.period = self.config.data["period"]
-        self.camera.quality = self.config.data["quality"]
+        self.camera.set_resolution(self.config.data["quality"])
 
     def check_config_received_event(self, config_received: bool) -> None:
         """
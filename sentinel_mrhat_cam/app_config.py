@@ -1,5 +1,5 @@
 import logging
-import json
+import orjson
 import re
 from .mqtt import MQTT
 from .static_config import CONFIGACKTOPIC, MINIMUM_WAIT_TIME, MAXIMUM_WAIT_TIME
@@ -45,7 +45,9 @@ class Config:
             logging.error(e)
             mqtt = MQTT()
             mqtt.connect()
-            mqtt.publish(f"config-nok|{str(e)}", CONFIGACKTOPIC)
+            msg_info = mqtt.publish(f"config-nok|{str(e)}", CONFIGACKTOPIC)
+            # Publishing is non-blocking, make sure the message is out before disconnecting
+            msg_info.wait_for_publish(timeout=5)
             mqtt.disconnect()
 
             # Load the default config
@@ -68,7 +70,7 @@ class Config:
 
         Raises
         ------
-        json.JSONDecodeError
+        orjson.JSONDecodeError
             If the configuration file contains invalid JSON format.
         FileNotFoundError
             If the configuration file is not found at the specified path.
@@ -76,14 +78,14 @@ class Config:
             If any other error occurs during the loading process.
         """
         try:
-            with open(self.path, "r") as file:
-                new_config = json.load(file)
+            with open(self.path, "rb") as file:
+                new_config = orjson.loads(file.read())
 
             Config.validate_config(new_config)
 
             self.data.update(new_config)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logging.error(f"Invalid JSON in the config file: {str(e)}")
             raise
         except FileNotFoundError as e:
@@ -5,8 +5,16 @@ try:
 except ImportError:
     Picamera2 = MagicMock()
     controls = MagicMock()
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):
+    # libjpeg-turbo is not available on the dev machines, fall back to PIL
+    _turbo_jpeg = None
+from PIL import Image
 from .utils import log_execution_time
 import logging
+import io
 import numpy as np
 
 
@@ -46,24 +54,42 @@ class Camera:
         config : dict
             Configuration dictionary specifying the camera settings.
         """
+        # JPEG quality and the encoder handle are constant across all frames,
+        # so they are fixed here instead of being looked up per capture
         self.quality = 95
+        self._turbo_jpeg = _turbo_jpeg
+        # Reused across frames by the PIL fallback, so each capture does not
+        # allocate and throw away a JPEG-sized buffer
+        self._jpeg_buffer = io.BytesIO()
         self.cam = Picamera2()
+        self.set_resolution(config["quality"])
+
+    def set_resolution(self, quality_preset) -> None:
+        """
+        Sets the capture resolution from the premade quality preset in the config.
 
-        # Set the premade settings
-        if config["quality"] == "4K":
+        If an invalid preset is specified, it defaults to 3K quality and logs an error.
+        Called from the constructor and again whenever a new config is received.
+
+        Parameters
+        ----------
+        quality_preset : str
+            One of the premade presets: "4K", "3K" or "HD".
+        """
+        if quality_preset == "4K":
             self.width = 3840
             self.height = 2160
-        elif config["quality"] == "3K":
+        elif quality_preset == "3K":
             self.width = 2560
             self.height = 1440
-        elif config["quality"] == "HD":
+        elif quality_preset == "HD":
             self.width = 1920
             self.height = 1080
         # If the specified quality is not found, default to 3K quality
         else:
             self.width = 2560
             self.height = 1440
-            logging.error(f"Invalid quality specified: {config['quality']}. Defaulting to 3K quality.")
+            logging.error(f"Invalid quality specified: {quality_preset}. Defaulting to 3K quality.")
 
     def start(self) -> None:
         """
@@ -99,3 +125,35 @@ class Camera:
             logging.error(f"Error during image capture: {e}")
             return None
         return image
+
+    @log_execution_time("Image capture and encode time:")
+    def capture_jpeg(self) -> bytes:
+        """
+        Captures an image and encodes it to JPEG in one step.
+
+        Producing the JPEG here means the raw multi-megabyte frame never leaves the
+        camera module: it goes straight from the capture buffer into the encoder
+        instead of being handed around as a numpy array first. TurboJPEG encodes
+        directly from the array (NEON SIMD on the Pi); PIL is the fallback when
+        libjpeg-turbo is not installed.
+
+        Returns
+        -------
+        bytes
+            The JPEG-encoded image, or None if the capture failed.
+        """
+        image_array = self.capture()
+        if image_array is None:
+            return None
+
+        if self._turbo_jpeg is not None:
+            # No-op when the capture buffer is already contiguous; prevents
+            # TurboJPEG from silently working on a strided view
+            image_array = np.ascontiguousarray(image_array)
+            return self._turbo_jpeg.encode(image_array, quality=self.quality, pixel_format=TJPF_RGB)
+
+        image: Image.Image = Image.fromarray(image_array)
+        self._jpeg_buffer.seek(0)
+        self._jpeg_buffer.truncate()
+        image.save(self._jpeg_buffer, format="JPEG", quality=self.quality)
+        return self._jpeg_buffer.getvalue()
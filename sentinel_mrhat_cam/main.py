@@ -57,6 +57,8 @@ def main():
         logging.info(f"Exit code in main: {e.code}\n Exiting the application because: {e}")
         sys.exit(e.code)
     finally:
+        # Publishing is non-blocking, wait for the last image before disconnecting
+        app.transmit.wait_for_publish()
         app.mqtt.disconnect()
         logger.disconnect_mqtt()
 
@@ -53,9 +53,12 @@ class MQTT:
         self.broker_connect_counter = 0
         self.config_received_event = threading.Event()
         self.config_confirm_message = "config-nok|Confirm message uninitialized"
+        # Connection state maintained by the on_connect/on_disconnect callbacks,
+        # checking it does not take paho's internal lock like client.is_connected()
+        self._connected = threading.Event()
 
     def is_connected(self) -> bool:
-        return self.client.is_connected() if self.client else False
+        return self._connected.is_set()
 
     def reset_config_received_event(self) -> None:
         self.config_received_event.clear()
@@ -113,16 +116,29 @@ class MQTT:
         try:
             def on_connect(client, userdata, flags, rc, properties=None):
                 if rc == 0:
+                    self._connected.set()
                     logging.info("Connected to MQTT Broker!")
                 else:
                     logging.error(f"Failed to connect, return code {rc}")
 
+            def on_disconnect(client, userdata, flags, rc, properties=None):
+                self._connected.clear()
+                logging.warning(f"Disconnected from MQTT Broker, return code {rc}")
+
+            def on_publish(client, userdata, mid, reason_code=None, properties=None):
+                logging.debug(f"Message {mid} published")
+
             # Making sure we can reach the broker before trying to connect
             self.broker_check()
 
             self.client.on_connect = on_connect
+            self.client.on_disconnect = on_disconnect
+            self.client.on_publish = on_publish
             self.client.username_pw_set(USERNAME, PASSWORD)
             self.client.disable_logger()
+            # Let paho's network loop reconnect on its own with exponential backoff,
+            # instead of blocking any of our threads while the broker is away
+            self.client.reconnect_delay_set(min_delay=1, max_delay=16)
 
             self.client.connect(self.broker, self.port)
             # Resetting the counter after a successful connection
@@ -215,19 +231,23 @@ class MQTT:
             logging.error(f"Error during creating connection: {e}")
             exit(1)
 
-    def publish(self, message, topic) -> None:
+    def publish(self, message, topic):
         """
         Publishes a message to a specified MQTT topic.
 
         This method sends a message to the MQTT broker to be published on a specified topic.
         It uses the MQTT client to publish the message with QoS = 2.
-        The method waits for the message (max 5 seconds) to be published and handles any errors that might occur during
-        the publishing process.
+        The call is non-blocking: the QoS handshake is handled by paho's network loop
+        in the background, so the capture loop can already work on the next frame
+        while the broker acknowledges the previous one. The `on_publish` callback set
+        in `connect` logs the completion.
 
         Parameters:
         ----------
-        message : str
-            The payload to be published to the MQTT topic.
+        message : bytes or str
+            The payload to be published to the MQTT topic. Image messages arrive
+            here as bytes and are handed to paho untouched — passing a str would
+            cost paho an extra UTF-8 encode pass over the multi-megabyte payload.
 
         topic : str
             The topic string to which the message should be published.
@@ -237,8 +257,11 @@ class MQTT:
         client.publish(topic, message, qos) -> MQTTMessageInfo:
             Sends a message to the broker on the specified topic.
 
-        msg_info.wait_for_publish(timeout) -> None:
-            Blocks until the message publishing is acknowledged or the 5 second time limit is met.
+        Returns:
+        -------
+        MQTTMessageInfo:
+            Handle for the in-flight message, so callers that are about to
+            disconnect can still wait for the delivery to finish.
 
         Raises:
         -------
@@ -246,8 +269,7 @@ class MQTT:
             Exits the script if an error occurs during the publishing process.
         """
         try:
-            msg_info = self.client.publish(topic, message, qos=self.qos)
-            msg_info.wait_for_publish(timeout=5)
+            return self.client.publish(topic, message, qos=self.qos)
         except Exception:
             exit(1)
 
@@ -258,5 +280,7 @@ class MQTT:
         This method stops the network loop and disconnects the client from the MQTT broker.
         """
         if self.client:
+            # The loop is stopped first, so on_disconnect may never fire
+            self._connected.clear()
             self.client.loop_stop()
             self.client.disconnect()
@@ -5,11 +5,18 @@ from .static_config import TIME_TO_BOOT_AND_SHUTDOWN, SHUTDOWN_THRESHOLD
 from .system import System, RTC
 import pytz
 
+# Bound once at import: skips the LOAD_ATTR lookup on datetime in the per-cycle path
+_fromisoformat = datetime.fromisoformat
+
 
 class Schedule:
     def __init__(self, period):
         self.period = period
         self.time_offset = 2  # Budapest is UTC+2
+        # Cache of the parsed working hours, keyed by the raw config strings
+        self._working_hours = None
+        self._wake_up_time = None
+        self._shut_down_time = None
 
     def should_shutdown(self, waiting_time) -> bool:
         """
@@ -85,7 +92,7 @@ class Schedule:
             The time at which the system should wake up.
         """
         current_time_str = RTC.get_time()
-        current_time = datetime.fromisoformat(current_time_str)
+        current_time = _fromisoformat(current_time_str)
 
         # Ensure the datetime is timezone-aware
         if current_time.tzinfo is None:
@@ -112,11 +119,22 @@ class Schedule:
             The wake-up time in "HH:MM:SS" format.
         shutDownTime : str
             The shutdown time in "HH:MM:SS" format.
+
+        Notes
+        -----
+        This method runs every cycle but the time strings only change on a config
+        update, so the `strptime` results are cached and only recomputed when the
+        strings differ from the cached ones.
         """
-        wake_up_time: time = datetime.strptime(wakeUpTime, "%H:%M:%S").time()
-        shut_down_time: time = datetime.strptime(shutDownTime, "%H:%M:%S").time()
+        if self._working_hours != (wakeUpTime, shutDownTime):
+            self._wake_up_time = datetime.strptime(wakeUpTime, "%H:%M:%S").time()
+            self._shut_down_time = datetime.strptime(shutDownTime, "%H:%M:%S").time()
+            self._working_hours = (wakeUpTime, shutDownTime)
+
+        wake_up_time: time = self._wake_up_time
+        shut_down_time: time = self._shut_down_time
 
-        utc_time: datetime = datetime.fromisoformat(RTC.get_time())
+        utc_time: datetime = _fromisoformat(RTC.get_time())
         current_time: time = utc_time.time()
 
         local_wake_up_time = self.adjust_time(wakeUpTime)
@@ -14,6 +14,8 @@ setup(
                       'pytz',
                       'paho-mqtt',
                       'numpy',
-                      'pybase64',
+                      'msgspec',
+                      'orjson',
+                      'PyTurboJPEG',
                       'pdocs']
 )